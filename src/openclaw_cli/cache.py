@@ -0,0 +1,55 @@
+"""Persistent cache of per-session-file read state, stored under ~/.openclaw."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from typing import Any
+
+from openclaw_cli.parse import json_loads
+from openclaw_cli.paths import OPENCLAW_DIR
+
+try:
+    from orjson import dumps as _dumps
+except ImportError:  # orjson is an optional speedup
+    import json
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+CACHE_PATH = OPENCLAW_DIR / ".ocli-cache.json"
+
+# Bump when the layout of cache entries changes; older caches are discarded.
+CACHE_VERSION = 3
+
+
+def load_cache() -> dict[str, Any]:
+    """Load the cache, returning an empty one if it is missing, unreadable, or stale."""
+    try:
+        with open(CACHE_PATH, "rb") as f:
+            cache = json_loads(f.read())
+    except (OSError, ValueError):
+        return {"version": CACHE_VERSION, "files": {}}
+    if not isinstance(cache, dict) or cache.get("version") != CACHE_VERSION:
+        return {"version": CACHE_VERSION, "files": {}}
+    cache.setdefault("files", {})
+    return cache
+
+
+def save_cache(cache: dict[str, Any]) -> None:
+    """Atomically write the cache. Failures are ignored; the cache is only an optimization."""
+    cache["version"] = CACHE_VERSION
+    try:
+        fd, tmp = tempfile.mkstemp(dir=CACHE_PATH.parent, prefix=".ocli-cache.", suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_dumps(cache))
+        os.replace(tmp, CACHE_PATH)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
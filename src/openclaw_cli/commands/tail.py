@@ -2,68 +2,114 @@
 
 from __future__ import annotations
 
-import json
+import heapq
 import os
-import select
+import re
 import sys
 import time
-from pathlib import Path
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO
 
 import click
 from rich.console import Console
 from rich.text import Text
 
-from openclaw_cli.parse import ParsedMessage, extract_session_id, parse_line
-from openclaw_cli.paths import get_agents, get_session_files
+from openclaw_cli.cache import load_cache, save_cache
+from openclaw_cli.parse import (
+    JSONDecodeError,
+    ParsedMessage,
+    extract_session_id,
+    json_loads,
+    may_contain_message,
+    parse_line,
+)
+from openclaw_cli.paths import get_agents, get_session_dir, get_session_files
+from openclaw_cli.watch import FileWatcher
 
 
 console = Console()
 
+# When stdout isn't a terminal (e.g. `ocli tail | grep`), messages skip Rich entirely and
+# are written as plain text, one write per batch.
+_ISATTY = console.is_terminal
+
+# Identifies an open session file independent of its name: (st_dev, st_ino)
+FileKey = tuple[int, int]
+
+# Bytes requested per os.read() call when draining a tailed file.
+READ_CHUNK_SIZE = 65536
+
+# Lines shorter than this can't be a message and are never handed to the JSON parser.
+MIN_LINE_BYTES = 8
+
+# Bytes read from the top of a new session file to find its model_change header.
+SESSION_HEADER_BYTES = 8192
+
+# Bytes read per step when scanning a session file backwards for --last.
+REVERSE_CHUNK_SIZE = 16384
+
+# Bytes at the end of a session file hinted for readahead before scanning it for --last.
+REVERSE_READAHEAD_BYTES = 4 * REVERSE_CHUNK_SIZE
+
+# posix_fadvise readahead hints are only available on some platforms (not macOS).
+HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+# Session files up to this size are checked for message lines before being scanned for --last.
+PREFILTER_MAX_SIZE = 8192
 
-def format_message(msg: ParsedMessage, *, show_session: bool = True) -> Text:
-    """Format a ParsedMessage for terminal display."""
+# session_id -> "(xxxxxxxx)" display tag
+_SHORT_ID_CACHE: dict[str, str] = {}
+
+# (role, model) -> (badge text, style)
+_BADGE_CACHE: dict[tuple[str, str | None], tuple[str, str]] = {}
+
+# Everything up to and including the "[User Message]" marker in a "[Tue 2026-...]" prefix
+_USER_PREFIX_RE = re.compile(r"^\[.*?\[User Message\]\s*", re.DOTALL)
+
+
+def format_message(msg: ParsedMessage, *, show_session: bool = True) -> Text | str:
+    """Format a ParsedMessage for display.
+
+    Returns styled Text for a terminal, or a plain str when output is piped.
+    """
     local_ts = msg.timestamp.astimezone()
     time_str = local_ts.strftime("%H:%M:%S")
 
-    line = Text()
+    # (text, style) segments
+    parts: list[tuple[str, str]] = []
+    ap = parts.append
 
     # Timestamp
-    line.append(time_str, style="dim")
-    line.append(" ")
+    ap((time_str, "dim"))
+    ap((" ", ""))
 
     # Agent
-    line.append(f"[{msg.agent}]", style="cyan")
-    line.append(" ")
+    ap((f"[{msg.agent}]", "cyan"))
+    ap((" ", ""))
 
     # Session (short)
     if show_session:
-        short_id = msg.session_id[:8]
-        line.append(f"({short_id})", style="dim")
-        line.append(" ")
+        sid = msg.session_id
+        short_id = _SHORT_ID_CACHE.get(sid) or _SHORT_ID_CACHE.setdefault(sid, f"({sid[:8]})")
+        ap((short_id, "dim"))
+        ap((" ", ""))
 
     # Role badge
-    if msg.role == "user":
-        line.append("USER ", style="bold green")
-    elif msg.role == "assistant":
-        model_tag = msg.model or "unknown"
-        if model_tag == "delivery-mirror":
-            line.append("AI(mirror) ", style="bold blue")
-        else:
-            line.append(f"AI({model_tag}) ", style="bold magenta")
+    badge = _BADGE_CACHE.get((msg.role, msg.model)) or _badge(msg.role, msg.model)
+    if badge[0]:
+        ap(badge)
 
     # Cost
     if msg.cost is not None and msg.cost > 0:
-        line.append(f"${msg.cost:.4f} ", style="yellow")
+        ap((f"${msg.cost:.4f} ", "yellow"))
 
     # Text (truncate long messages for tail view)
     text = msg.text
     # Strip the [Tue 2026-...] prefix from user messages for readability
-    if msg.role == "user" and text.startswith("["):
-        # Find "[User Message]" marker
-        marker = "[User Message]"
-        idx = text.find(marker)
-        if idx != -1:
-            text = text[idx + len(marker) :].strip()
+    if msg.role == "user":
+        text = _USER_PREFIX_RE.sub("", text, count=1)
 
     # Collapse to single line for tail view, truncate
     text_oneline = text.replace("\n", " ↵ ")
@@ -71,8 +117,48 @@ def format_message(msg: ParsedMessage, *, show_session: bool = True) -> Text:
     if len(text_oneline) > max_width:
         text_oneline = text_oneline[: max_width - 1] + "…"
 
-    line.append(text_oneline)
-    return line
+    ap((text_oneline, ""))
+    if _ISATTY:
+        return Text.assemble(*parts)
+    return "".join([part[0] for part in parts])
+
+
+def _emit(lines: list[Text | str]) -> None:
+    """Write a batch of format_message() results with a single write."""
+    if _ISATTY:
+        console.print(Text("\n").join(lines))
+    else:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+
+def _badge(role: str, model: str | None) -> tuple[str, str]:
+    """Compute and cache the (text, style) role badge for a role/model pair."""
+    if role == "user":
+        badge = ("USER ", "bold green")
+    elif role == "assistant":
+        model_tag = model or "unknown"
+        if model_tag == "delivery-mirror":
+            badge = ("AI(mirror) ", "bold blue")
+        else:
+            badge = (f"AI({model_tag}) ", "bold magenta")
+    else:
+        badge = ("", "")
+    _BADGE_CACHE[(role, model)] = badge
+    return badge
+
+
+@dataclass(slots=True)
+class FileState:
+    """An open session file being tailed."""
+
+    fd: int
+    agent: str
+    session_id: str
+    short_id: str
+    offset: int  # bytes consumed from fd so far
+    buf: bytearray = field(default_factory=bytearray)  # trailing partial line
+    announce: bool = False  # "new session" notice waiting for the model_change header
 
 
 class SessionTailer:
@@ -91,31 +177,103 @@ class SessionTailer:
         self.poll_interval = poll_interval
         self.new_files_interval = new_files_interval
 
-        # path -> (file handle, agent, session_id)
-        self._files: dict[Path, tuple[object, str, str]] = {}
+        # Keyed by (st_dev, st_ino) so a renamed file isn't opened twice and a replaced one
+        # is picked up. Only _scan_files adds entries, never while the dict is being iterated.
+        self._files: dict[FileKey, FileState] = {}
         self._last_scan = 0.0
+        self._watcher = FileWatcher()
+        # Agents whose sessions dir has no inotify watch yet (e.g. it doesn't exist yet)
+        self._unwatched_agents: list[str] = list(agents)
 
-    def _scan_files(self) -> list[tuple[str, str, str | None]]:
-        """Discover new session files. Returns list of (agent, session_id, model) for new files."""
-        new: list[tuple[str, str, str | None]] = []
+    def _scan_files(self) -> list[tuple[FileState, str | None]]:
+        """Discover new session files. Returns (state, model) for each new file."""
+        new: list[tuple[FileState, str | None]] = []
         for agent in self.agents:
             for path in get_session_files(agent, include_deleted=self.include_deleted):
-                if path not in self._files:
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                key = (st.st_dev, st.st_ino)
+                if key not in self._files:
                     try:
-                        fh = open(path, "r")  # noqa: SIM115
-                        # Read header lines to get model info before seeking to end
-                        model = _read_session_model(path)
-                        fh.seek(0, os.SEEK_END)
-                        session_id = extract_session_id(path)
-                        self._files[path] = (fh, agent, session_id)
-                        new.append((agent, session_id, model))
+                        fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
                     except OSError:
-                        pass
+                        continue
+                    try:
+                        if HAS_FADVISE:
+                            # Tailed files are only ever read forward
+                            _fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                        # Read header lines to get model info before seeking to end
+                        model = _read_session_model(fd)
+                        if self._watcher.active and not self._watcher.watch_file(path, key):
+                            # Out of inotify watches; poll every file instead
+                            self._watcher.close()
+                        offset = os.lseek(fd, 0, os.SEEK_END)
+                    except OSError:  # includes the file vanishing before it could be watched
+                        os.close(fd)
+                        continue
+                    session_id = extract_session_id(path)
+                    state = FileState(fd, agent, session_id, session_id[:8], offset)
+                    self._files[key] = state
+                    new.append((state, model))
         self._last_scan = time.monotonic()
         return new
 
+    def _read_new_messages(self, states: Iterable[FileState]) -> bool:
+        """Print any complete new messages from the given files. Returns True if any printed."""
+        pending: list[Text | str] = []
+        announced: list[tuple[FileState, str | None]] = []
+        for state in states:
+            try:
+                if os.fstat(state.fd).st_size < state.offset:
+                    # Truncated or rewritten in place; start over from the top
+                    state.offset = os.lseek(state.fd, 0, os.SEEK_SET)
+                    state.buf.clear()
+            except OSError:
+                continue
+            agent = state.agent
+            session_id = state.session_id
+            before = len(pending)
+            for line in _read_lines(state):
+                if len(line) < MIN_LINE_BYTES:
+                    continue
+                msg = parse_line(line, agent, session_id)
+                if msg:
+                    pending.append(format_message(msg))
+            if state.announce:
+                # The writer adds the model_change header after creating the file; wait for
+                # it, but don't hold the notice back past the session's first message
+                model = _read_session_model(state.fd)
+                if model is not None or len(pending) > before:
+                    state.announce = False
+                    announced.append((state, model))
+        for state, model in announced:
+            _print_new_session(state, model)
+        if pending:
+            _emit(pending)
+        return bool(pending)
+
+    def _watch_dirs(self) -> bool:
+        """Add inotify watches on sessions dirs that lack one. Returns True if any were added."""
+        added = False
+        for agent in list(self._unwatched_agents):
+            try:
+                ok = self._watcher.watch_dir(get_session_dir(agent))
+            except FileNotFoundError:
+                continue  # doesn't exist yet; retried every new_files_interval
+            if not ok:
+                # Out of inotify watches; poll every file instead
+                self._watcher.close()
+                break
+            self._unwatched_agents.remove(agent)
+            added = True
+        return added
+
     def tail(self) -> None:
         """Tail all session files, yielding formatted output."""
+        if self._watcher.active:
+            self._watch_dirs()
         self._scan_files()
 
         agent_str = ", ".join(self.agents) if self.agents else "none"
@@ -127,59 +285,92 @@ class SessionTailer:
 
         try:
             while True:
-                # Periodically scan for new files
-                if time.monotonic() - self._last_scan > self.new_files_interval:
+                if self._watcher.active:
+                    # Sleep until inotify reports an append or a new session file, waking
+                    # periodically while some sessions dir still needs a watch
+                    timeout = self.new_files_interval if self._unwatched_agents else None
+                    touched, created = self._watcher.wait(timeout)
+                    if self._unwatched_agents and self._watch_dirs():
+                        created = True
+                else:
+                    touched = None
+                    created = time.monotonic() - self._last_scan > self.new_files_interval
+
+                if created:
                     new = self._scan_files()
-                    for agent, session_id, model in new:
-                        model_str = f" model={model}" if model else ""
-                        console.print(
-                            f"  [dim]+[/dim] new session [cyan][{agent}][/cyan] [dim]({session_id[:8]})[/dim] [magenta]{model_str}[/magenta]"
-                        )
-
-                found_any = False
-                for path, (fh, agent, session_id) in list(self._files.items()):
-                    while True:
-                        line = fh.readline()
-                        if not line:
-                            break
-                        line = line.strip()
-                        if not line:
-                            continue
-                        msg = parse_line(line, agent, session_id)
-                        if msg:
-                            console.print(format_message(msg))
-                            found_any = True
-
-                if not found_any:
-                    # Use select on stdin for responsive Ctrl+C on some systems
+                    for state, model in new:
+                        if model is None:
+                            # Just created; announce once its header has been written
+                            state.announce = True
+                        else:
+                            _print_new_session(state, model)
+
+                if touched is None:
+                    found_any = self._read_new_messages(self._files.values())
+                else:
+                    found_any = self._read_new_messages(
+                        [self._files[key] for key in touched if key in self._files]
+                    )
+
+                if not self._watcher.active and not found_any:
                     time.sleep(self.poll_interval)
 
         except KeyboardInterrupt:
             console.print("\n[dim]Stopped.[/dim]")
         finally:
-            for path, (fh, _, _) in self._files.items():
+            self._watcher.close()
+            for state in self._files.values():
                 try:
-                    fh.close()
-                except Exception:
+                    os.close(state.fd)
+                except OSError:
                     pass
 
 
-def _read_session_model(path: Path) -> str | None:
-    """Read the model from the first few lines of a session JSONL file."""
+def _print_new_session(state: FileState, model: str | None) -> None:
+    """Print the notice for a session file that appeared while tailing."""
+    model_str = f" model={model}" if model else ""
+    console.print(
+        f"  [dim]+[/dim] new session [cyan][{state.agent}][/cyan] "
+        f"[dim]({state.short_id})[/dim] [magenta]{model_str}[/magenta]"
+    )
+
+
+def _read_lines(state: FileState) -> list[bytes]:
+    """Drain everything currently readable from a tailed file and return the complete lines.
+
+    Bytes after the last newline are kept in state.buf until the rest of the line arrives.
+    """
+    buf = state.buf
+    while True:
+        try:
+            data = os.read(state.fd, READ_CHUNK_SIZE)
+        except BlockingIOError:
+            break
+        if not data:
+            break
+        state.offset += len(data)
+        buf.extend(data)
+    if b"\n" not in buf:
+        return []
+    # Split a bytes copy: bytearray.split() would hand parse_line bytearray lines
+    lines = bytes(buf).split(b"\n")
+    buf[:] = lines.pop()
+    return lines
+
+
+def _read_session_model(fd: int) -> str | None:
+    """Read the model from the first few lines of an open session JSONL file."""
     try:
-        with open(path, "r") as f:
-            for _ in range(5):
-                line = f.readline()
-                if not line:
-                    break
-                try:
-                    obj = json.loads(line)
-                    if obj.get("type") == "model_change":
-                        return obj.get("modelId")
-                except (json.JSONDecodeError, ValueError):
-                    continue
+        head = os.pread(fd, SESSION_HEADER_BYTES, 0)
     except OSError:
-        pass
+        return None
+    for line in head.split(b"\n", 5)[:5]:
+        try:
+            obj = json_loads(line)
+            if obj.get("type") == "model_change":
+                return obj.get("modelId")
+        except (JSONDecodeError, ValueError, AttributeError):
+            continue
     return None
 
 
@@ -256,41 +447,252 @@ def tail(
 
 def _show_last_n(agents: list[str], n: int, *, include_deleted: bool = False) -> None:
     """Show the last N messages across all agents, sorted by time."""
-    all_messages: list[ParsedMessage] = []
+    # Min-heap of the newest n messages seen so far: (epoch seconds, file index, line order,
+    # message). Plain float keys keep comparisons cheap and never mix naive/aware datetimes.
+    heap: list[tuple[float, int, int, ParsedMessage]] = []
+    # Once n messages are held, anything older than the oldest of them can't show
+    floor: float | None = None
+
+    cache = load_cache()
+    files_cache: dict[str, dict[str, Any]] = cache["files"]
+    files = [
+        (agent, path)
+        for agent in agents
+        for path in get_session_files(agent, include_deleted=include_deleted)
+    ]
+
+    results: list[list[ParsedMessage]] = [[] for _ in files]
+
+    def load(agent: str, path: str) -> tuple[list[ParsedMessage], dict[str, Any] | None]:
+        # floor is read when the task starts, so later files benefit from earlier results
+        return _recent_messages(path, agent, files_cache.get(path), n, floor)
+
+    def store(i: int, messages: list[ParsedMessage], entry: dict[str, Any] | None) -> None:
+        results[i] = messages
+        if entry is None:
+            files_cache.pop(files[i][1], None)
+        else:
+            files_cache[files[i][1]] = entry
+
+    def push(i: int, messages: list[ParsedMessage]) -> None:
+        nonlocal floor
+        for j, msg in enumerate(messages):
+            item = (msg.timestamp.timestamp(), i, j, msg)
+            if len(heap) < n:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+        if len(heap) >= n:
+            floor = heap[0][0]
+
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        futures = {ex.submit(load, agent, path): i for i, (agent, path) in enumerate(files)}
+        for future in as_completed(futures):
+            i = futures[future]
+            messages, entry = future.result()
+            store(i, messages, entry)
+            push(i, messages)
+
+    # A cached scan that stopped at an earlier run's floor still covers this run only if
+    # everything it skipped is older than the final floor; rescan the ones that don't
+    stale = []
+    for i, (_agent, path) in enumerate(files):
+        entry = files_cache.get(path)
+        if (
+            entry is not None
+            and entry["stopped_at"] is not None
+            and len(entry["messages"]) < n
+            and (floor is None or entry["stopped_at"] >= floor)
+        ):
+            stale.append(i)
+    if stale:
+        for i in stale:
+            agent, path = files[i]
+            store(i, *_recent_messages(path, agent, None, n, floor))
+        heap.clear()
+        floor = None
+        for i, messages in enumerate(results):
+            push(i, messages)
+
+    # Forget files that no longer exist for the agents that were listed
+    seen = {path for _, path in files}
+    for key in [k for k, e in files_cache.items() if e["agent"] in agents and k not in seen]:
+        del files_cache[key]
+    save_cache(cache)
+
+    if heap:
+        _emit([format_message(msg) for _, _, _, msg in sorted(heap)])
+        console.print()
 
-    for agent in agents:
-        for path in get_session_files(agent, include_deleted=include_deleted):
-            session_id = extract_session_id(path)
-            try:
-                # Read from the end efficiently
-                lines = _tail_lines(path, max_lines=n * 3)  # over-read since many lines aren't text
-                for line in lines:
-                    msg = parse_line(line, agent, session_id)
-                    if msg:
-                        all_messages.append(msg)
-            except OSError:
-                pass
 
-    # Sort by timestamp, take last N
-    all_messages.sort(key=lambda m: m.timestamp)
-    for msg in all_messages[-n:]:
-        console.print(format_message(msg))
+def _recent_messages(
+    path: str,
+    agent: str,
+    entry: dict[str, Any] | None,
+    n: int,
+    floor: float | None = None,
+) -> tuple[list[ParsedMessage], dict[str, Any] | None]:
+    """Return up to the last n messages of a session file, oldest first, and its cache entry.
+
+    An unchanged file is served straight from its cache entry. A file that only grew is
+    scanned backwards from the end down to the cached offset, and the cached messages are
+    only needed if that turns up fewer than n. Anything else is scanned backwards from the
+    end, stopping after n messages or at the first message older than floor (epoch seconds).
+    A scan cut short by floor records that message's time as the entry's "stopped_at"; such
+    an entry holds fewer than n messages, and the caller decides whether it still covers
+    enough.
+    """
+    session_id = extract_session_id(path)
+    try:
+        st = os.stat(path)
+        if entry is not None and entry["mtime"] == st.st_mtime and entry["size"] == st.st_size:
+            if entry["complete"] or len(entry["messages"]) >= n or entry["stopped_at"] is not None:
+                return [ParsedMessage.from_cache(m) for m in entry["messages"]], entry
+        if (
+            entry is not None
+            and (entry["complete"] or len(entry["messages"]) >= n)
+            and st.st_size >= entry["size"]
+        ):
+            with open(path, "rb") as f:
+                new, offset, reached, _ = _scan_back(
+                    f, st.st_size, agent, session_id, n, stop=entry["offset"]
+                )
+            new.reverse()
+            if reached:
+                cached = [ParsedMessage.from_cache(m) for m in entry["messages"]]
+                combined = cached + new
+                messages = combined[-max(n, len(cached)) :]
+                # Trimming drops the oldest messages, so the entry no longer covers the file
+                complete = entry["complete"] and len(messages) == len(combined)
+            else:
+                messages = new
+                complete = False
+            entry = {
+                **entry,
+                "mtime": st.st_mtime,
+                "size": st.st_size,
+                "offset": offset or entry["offset"],
+                "complete": complete,
+                "stopped_at": None,
+                "messages": [m.to_cache() for m in messages],
+            }
+            return messages, entry
+
+        with open(path, "rb") as f:
+            if _file_likely_has_messages(f.fileno(), st.st_size):
+                messages, offset, complete, stopped_at = _scan_back(
+                    f, st.st_size, agent, session_id, n, floor=floor
+                )
+            else:
+                # Cached as complete and empty; offset 0 makes a later append re-read it all
+                messages, offset, complete, stopped_at = [], 0, True, None
+    except OSError:
+        return [], None
+
+    messages.reverse()
+    entry = {
+        "agent": agent,
+        "mtime": st.st_mtime,
+        "size": st.st_size,
+        "offset": offset,
+        "complete": complete,
+        "stopped_at": stopped_at,
+        "messages": [m.to_cache() for m in messages],
+    }
+    return messages, entry
+
+
+def _scan_back(
+    f: BinaryIO,
+    size: int,
+    agent: str,
+    session_id: str,
+    n: int,
+    *,
+    stop: int = 0,
+    floor: float | None = None,
+) -> tuple[list[ParsedMessage], int, bool, float | None]:
+    """Parse messages from the end of f back to offset stop, newest first.
+
+    Stops early after n messages or at the first message older than floor. Returns the
+    messages, the offset just past the last complete line (0 if no line ends after stop),
+    whether stop was reached, and the time of the message that hit floor, if one did.
+    """
+    if HAS_FADVISE:
+        # One hint for the window most scans stay within, rather than one per chunk
+        start = max(stop, size - REVERSE_READAHEAD_BYTES)
+        _fadvise(f.fileno(), start, size - start, os.POSIX_FADV_WILLNEED)
+    messages: list[ParsedMessage] = []
+    offset = 0
+    for start, line in _reverse_lines(f, size):
+        if start < stop:
+            break
+        if not offset:
+            offset = start + len(line) + 1
+        msg = parse_line(line, agent, session_id)
+        if msg is None:
+            continue
+        ts = msg.timestamp.timestamp()
+        if floor is not None and ts < floor:
+            return messages, offset, False, ts
+        messages.append(msg)
+        if len(messages) >= n:
+            return messages, offset, False, None
+    return messages, offset, True, None
+
+
+def _file_likely_has_messages(fd: int, size: int) -> bool:
+    """Return False if a session file certainly has no user/assistant messages.
+
+    Only files up to PREFILTER_MAX_SIZE are checked, with a single pread; sampling the head
+    and tail of a larger file could miss messages in the middle, so those return True.
+    """
+    if size > PREFILTER_MAX_SIZE:
+        return True
+    return may_contain_message(os.pread(fd, size, 0))
 
-    if all_messages:
-        console.print()
 
+def _reverse_lines(f: BinaryIO, size: int) -> Iterator[tuple[int, bytes]]:
+    """Yield (offset, line) for each newline-terminated line of f, last line first.
 
-def _tail_lines(path: Path, max_lines: int = 100) -> list[str]:
-    """Read the last max_lines from a file efficiently."""
+    The file is read backwards in REVERSE_CHUNK_SIZE chunks, so a caller that stops early
+    only touches the end of it. Bytes after the final newline (a line still being written)
+    are skipped.
+    """
+    pos = size
+    # Pieces of the line being assembled, last piece first; None until the final newline
+    # has been found. They are joined once, when the line's start turns up.
+    parts: list[bytes] | None = None
+    while pos > 0:
+        step = min(REVERSE_CHUNK_SIZE, pos)
+        pos -= step
+        f.seek(pos)
+        chunk = f.read(step)
+        end = chunk.rfind(b"\n")
+        if end == -1:
+            if parts is not None:
+                parts.append(chunk)
+            continue
+        if parts is not None:
+            parts.append(chunk[end + 1 :])
+            parts.reverse()
+            yield pos + end + 1, b"".join(parts)
+        while True:
+            idx = chunk.rfind(b"\n", 0, end)
+            if idx == -1:
+                break
+            yield pos + idx + 1, chunk[idx + 1 : end]
+            end = idx
+        parts = [chunk[:end]]
+    if parts is not None:
+        parts.reverse()
+        line = b"".join(parts)
+        if line:
+            yield 0, line
+def _fadvise(fd: int, offset: int, length: int, advice: int) -> None:
+    """Give the kernel a readahead hint; failures are harmless and ignored."""
     try:
-        with open(path, "rb") as f:
-            # Seek back in chunks to find enough lines
-            f.seek(0, os.SEEK_END)
-            size = f.tell()
-            chunk = min(size, max_lines * 2048)  # ~2KB per line estimate
-            f.seek(max(0, size - chunk))
-            data = f.read().decode("utf-8", errors="replace")
-            lines = data.strip().split("\n")
-            return lines[-max_lines:]
+        os.posix_fadvise(fd, offset, length, advice)
     except OSError:
-        return []
+        pass
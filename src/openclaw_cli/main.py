@@ -1,15 +1,37 @@
 """Entry point for the openclaw-cli."""
 
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
 import click
 
 from openclaw_cli import __version__
-from openclaw_cli.commands.tail import tail
 
 
-@click.group()
+class LazyGroup(click.Group):
+    """A click Group that imports a subcommand's module only when that command is used.
+
+    Keeps `ocli --version` and friends from paying for rich and the command modules.
+    """
+
+    def __init__(self, *args: Any, lazy_commands: dict[str, str] | None = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # command name -> "module:attribute"
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_commands:
+            module_name, attr = self.lazy_commands[cmd_name].split(":")
+            return getattr(importlib.import_module(module_name), attr)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(cls=LazyGroup, lazy_commands={"tail": "openclaw_cli.commands.tail:tail"})
 @click.version_option(version=__version__, prog_name="ocli")
 def cli() -> None:
     """CLI utilities for OpenClaw."""
-
-
-cli.add_command(tail)
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass, field
+import os
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 
+try:
+    from orjson import JSONDecodeError
+    from orjson import loads as json_loads
+except ImportError:  # orjson is an optional speedup
+    from json import JSONDecodeError
+    from json import loads as json_loads
 
-@dataclass
+
+@dataclass(slots=True)
 class ParsedMessage:
     """A human-readable message extracted from a session log line."""
 
@@ -21,17 +28,66 @@ class ParsedMessage:
     text: str = ""
     cost: float | None = None
     stop_reason: str | None = None
-    raw: dict = field(default_factory=dict, repr=False)
-
 
-def parse_line(line: str, agent: str, session_id: str) -> ParsedMessage | None:
-    """Parse a single JSONL line into a ParsedMessage, or None if not a text message."""
-    try:
-        obj = json.loads(line)
-    except (json.JSONDecodeError, ValueError):
+    def to_cache(self) -> dict[str, Any]:
+        """Return a JSON-serializable form for the persistent cache."""
+        return {
+            "timestamp": self.timestamp.isoformat(),
+            "role": self.role,
+            "agent": self.agent,
+            "session_id": self.session_id,
+            "model": self.model,
+            "provider": self.provider,
+            "text": self.text,
+            "cost": self.cost,
+            "stop_reason": self.stop_reason,
+        }
+
+    @classmethod
+    def from_cache(cls, data: dict[str, Any]) -> ParsedMessage:
+        """Rebuild a message stored with to_cache()."""
+        return cls(
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            role=data["role"],
+            agent=data["agent"],
+            session_id=data["session_id"],
+            model=data.get("model"),
+            provider=data.get("provider"),
+            text=data.get("text", ""),
+            cost=data.get("cost"),
+            stop_reason=data.get("stop_reason"),
+        )
+
+
+def may_contain_message(data: bytes | bytearray) -> bool:
+    """Cheap substring check: False only if data holds no user/assistant message line.
+
+    A True result proves nothing; the data still has to be parsed.
+    """
+    return b'"message"' in data and (b'"user"' in data or b'"assistant"' in data)
+
+
+def parse_line(line: bytes | bytearray | str, agent: str, session_id: str) -> ParsedMessage | None:
+    """Parse a single JSONL line into a ParsedMessage, or None if not a text message.
+
+    Raw bytes are preferred; the JSON parser decodes them itself, and lines that can't be
+    user/assistant messages are rejected by a substring check before parsing.
+    """
+    is_raw = isinstance(line, (bytes, bytearray))
+    if is_raw and not may_contain_message(line):
         return None
-
-    if obj.get("type") != "message":
+    try:
+        obj = json_loads(line)
+    except (JSONDecodeError, ValueError):
+        if not is_raw:
+            return None
+        # Invalid UTF-8 is rejected by the parser; show such lines with replacement characters
+        try:
+            obj = json_loads(line.decode("utf-8", errors="replace"))
+        except (JSONDecodeError, ValueError):
+            return None
+
+    if not isinstance(obj, dict) or obj.get("type") != "message":
         return None
 
     msg = obj.get("message", {})
@@ -41,24 +97,26 @@ def parse_line(line: str, agent: str, session_id: str) -> ParsedMessage | None:
     if role not in ("user", "assistant"):
         return None
 
-    # Extract text content blocks
-    content = msg.get("content", [])
-    text_parts: list[str] = []
-    for block in content:
-        if isinstance(block, dict) and block.get("type") == "text":
-            text_parts.append(block.get("text", ""))
-        elif isinstance(block, str):
-            text_parts.append(block)
-
-    text = "\n".join(text_parts).strip()
+    # Extract text content blocks (content may also be a bare string)
+    content = msg.get("content") or ()
+    if isinstance(content, str):
+        text = content.strip()
+    else:
+        text_parts: list[str] = []
+        for block in content:
+            if isinstance(block, dict) and block.get("type") == "text":
+                text_parts.append(block.get("text", ""))
+            elif isinstance(block, str):
+                text_parts.append(block)
+        text = "\n".join(text_parts).strip()
     if not text:
         return None
 
     # Timestamp
-    ts_str = obj.get("timestamp", "")
     try:
-        ts = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-    except (ValueError, AttributeError):
+        # Python 3.11+ accepts the trailing "Z" directly
+        ts = datetime.fromisoformat(obj.get("timestamp", ""))
+    except (ValueError, TypeError, AttributeError):
         ts = datetime.now(timezone.utc)
 
     # Cost
@@ -76,11 +134,9 @@ def parse_line(line: str, agent: str, session_id: str) -> ParsedMessage | None:
         text=text,
         cost=cost,
         stop_reason=msg.get("stopReason"),
-        raw=obj,
     )
 
 
-def extract_session_id(path: Any) -> str:
+def extract_session_id(path: str | os.PathLike[str]) -> str:
     """Extract the session UUID from a file path."""
-    name = str(path.name) if hasattr(path, "name") else str(path)
-    return name.split(".")[0]
+    return os.path.basename(path).split(".", 1)[0]
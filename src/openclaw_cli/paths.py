@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+from operator import itemgetter
 from pathlib import Path
 
 
@@ -11,13 +13,13 @@ AGENTS_DIR = OPENCLAW_DIR / "agents"
 
 def get_agents() -> list[str]:
     """Return list of agent IDs that have session directories."""
-    if not AGENTS_DIR.is_dir():
+    try:
+        with os.scandir(AGENTS_DIR) as it:
+            return sorted(
+                e.name for e in it if e.is_dir() and os.path.isdir(os.path.join(e.path, "sessions"))
+            )
+    except OSError:
         return []
-    return sorted(
-        d.name
-        for d in AGENTS_DIR.iterdir()
-        if d.is_dir() and (d / "sessions").is_dir()
-    )
 
 
 def get_session_dir(agent: str) -> Path:
@@ -25,16 +27,21 @@ def get_session_dir(agent: str) -> Path:
     return AGENTS_DIR / agent / "sessions"
 
 
-def get_session_files(agent: str, include_deleted: bool = False) -> list[Path]:
+def get_session_files(agent: str, include_deleted: bool = False) -> list[str]:
     """Return all .jsonl session files for an agent, sorted by mtime (newest first)."""
-    session_dir = get_session_dir(agent)
-    if not session_dir.is_dir():
+    entries: list[tuple[str, float]] = []
+    try:
+        with os.scandir(get_session_dir(agent)) as it:
+            for e in it:
+                if not e.name.endswith(".jsonl"):
+                    continue
+                if not include_deleted and ".deleted." in e.name:
+                    continue
+                try:
+                    entries.append((e.path, e.stat().st_mtime))
+                except OSError:
+                    continue  # removed since the directory was read
+    except OSError:
         return []
-    files = []
-    for f in session_dir.iterdir():
-        if not f.name.endswith(".jsonl"):
-            continue
-        if not include_deleted and ".deleted." in f.name:
-            continue
-        files.append(f)
-    return sorted(files, key=lambda p: p.stat().st_mtime, reverse=True)
+    entries.sort(key=itemgetter(1), reverse=True)
+    return [p for p, _ in entries]
@@ -0,0 +1,108 @@
+"""Event-driven file change notification for tailing session logs.
+
+Uses inotify (via the optional ``inotify_simple`` package) on Linux. When it is
+unavailable, ``FileWatcher.active`` is False and callers fall back to polling.
+"""
+
+from __future__ import annotations
+
+import selectors
+from collections.abc import Hashable
+from pathlib import Path
+
+try:
+    from inotify_simple import INotify, flags
+except ImportError:  # inotify_simple is optional and Linux-only
+    INotify = None
+    flags = None
+
+
+class FileWatcher:
+    """Watch session files for appends and session directories for new files."""
+
+    def __init__(self) -> None:
+        self._inotify = None
+        self._selector: selectors.BaseSelector | None = None
+        # watch descriptor -> caller's key for the file, or the directory path
+        self._files: dict[int, Hashable] = {}
+        self._dirs: dict[int, Path] = {}
+
+        if INotify is None:
+            return
+        try:
+            self._inotify = INotify()
+        except OSError:
+            return
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._inotify, selectors.EVENT_READ)
+
+    @property
+    def active(self) -> bool:
+        """Whether change notifications are being delivered."""
+        return self._inotify is not None
+
+    def watch_file(self, path: str, key: Hashable) -> bool:
+        """Watch a file for appends, reported by wait() as key.
+
+        Returns False if the watch could not be added (e.g. the watch limit was hit). Raises
+        FileNotFoundError if the file no longer exists.
+        """
+        if self._inotify is None:
+            return False
+        try:
+            wd = self._inotify.add_watch(path, flags.MODIFY)
+        except FileNotFoundError:
+            raise
+        except OSError:
+            return False
+        self._files[wd] = key
+        return True
+
+    def watch_dir(self, path: Path) -> bool:
+        """Watch a directory for new files.
+
+        Returns False if the watch could not be added (e.g. the watch limit was hit). Raises
+        FileNotFoundError if the directory doesn't exist.
+        """
+        if self._inotify is None:
+            return False
+        try:
+            wd = self._inotify.add_watch(path, flags.CREATE | flags.MOVED_TO)
+        except FileNotFoundError:
+            raise
+        except OSError:
+            return False
+        self._dirs[wd] = path
+        return True
+
+    def wait(self, timeout: float | None = None) -> tuple[set[Hashable], bool]:
+        """Block until something changes.
+
+        Returns the keys of modified files and whether any watched directory gained a file.
+        """
+        modified: set[Hashable] = set()
+        created = False
+        if self._inotify is None or self._selector is None:
+            return modified, created
+
+        for _key, _mask in self._selector.select(timeout):
+            for event in self._inotify.read(timeout=0):
+                if event.wd in self._files:
+                    if event.mask & flags.IGNORED:
+                        del self._files[event.wd]
+                    else:
+                        modified.add(self._files[event.wd])
+                elif event.wd in self._dirs and event.name.endswith(".jsonl"):
+                    created = True
+        return modified, created
+
+    def close(self) -> None:
+        """Release the inotify instance. The watcher is inactive afterwards."""
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+        self._files.clear()
+        self._dirs.clear()
@@ -0,0 +1,69 @@
+"""Tests for parsing session JSONL lines."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from openclaw_cli import parse
+from openclaw_cli.parse import parse_line
+
+MESSAGE = (
+    b'{"type":"message","timestamp":"2026-01-01T00:00:00.000Z",'
+    b'"message":{"role":"user","content":[{"type":"text","text":"hi"}]}}'
+)
+
+
+@pytest.fixture
+def json_calls(monkeypatch):
+    """Count the lines handed to the JSON parser."""
+    calls = []
+
+    def counting_loads(data):
+        calls.append(data)
+        return loads(data)
+
+    loads = parse.json_loads
+    monkeypatch.setattr(parse, "json_loads", counting_loads)
+    return calls
+
+
+@pytest.mark.parametrize("kind", [bytes, bytearray, lambda b: b.decode()])
+def test_parse_line_accepts_each_input_type(kind):
+    msg = parse_line(kind(MESSAGE), "main", "abc123")
+    assert msg is not None
+    assert (msg.role, msg.text) == ("user", "hi")
+
+
+@pytest.mark.parametrize("kind", [bytes, bytearray])
+def test_prefilter_skips_json_for_non_message_lines(kind, json_calls):
+    assert parse_line(kind(b'{"type":"custom","data":{}}'), "main", "abc123") is None
+    assert json_calls == []
+
+
+@pytest.mark.parametrize("kind", [bytes, bytearray])
+def test_invalid_utf8_is_replaced(kind):
+    msg = parse_line(kind(MESSAGE.replace(b"hi", b"h\xff")), "main", "abc123")
+    assert msg is not None
+    assert msg.text == "h\ufffd"
+
+
+def test_text_blocks_are_joined_and_other_blocks_skipped():
+    line = MESSAGE.replace(
+        b'[{"type":"text","text":"hi"}]',
+        b'[{"type":"text","text":"a"},{"type":"toolCall","name":"x"},"b",{"type":"text"}]',
+    )
+    assert parse_line(line, "main", "abc123").text == "a\nb"
+
+
+def test_bare_string_content_is_the_text():
+    line = MESSAGE.replace(b'[{"type":"text","text":"hi"}]', b'" hello "')
+    assert parse_line(line, "main", "abc123").text == "hello"
+
+
+def test_timestamp_is_parsed_as_utc():
+    line = MESSAGE.replace(b"00:00:00.000Z", b"12:34:56.789Z")
+    assert parse_line(line, "main", "abc123").timestamp == datetime(
+        2026, 1, 1, 12, 34, 56, 789000, tzinfo=timezone.utc
+    )
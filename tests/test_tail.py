@@ -0,0 +1,167 @@
+"""Tests for reading session files in `ocli tail`."""
+
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from openclaw_cli import parse
+from openclaw_cli.commands import tail
+from openclaw_cli.commands.tail import (
+    FileState,
+    SessionTailer,
+    _read_lines,
+    _recent_messages,
+    _reverse_lines,
+)
+from openclaw_cli.parse import parse_line
+
+
+def _line(i: int) -> str:
+    return json.dumps(
+        {
+            "type": "message",
+            "timestamp": f"2026-01-01T00:00:{i:02d}.000Z",
+            "message": {"role": "user", "content": [{"type": "text", "text": f"m{i}"}]},
+        }
+    )
+
+
+def _write(path, start: int, stop: int, mode: str = "w") -> None:
+    with open(path, mode) as f:
+        for i in range(start, stop):
+            f.write(_line(i) + "\n")
+
+
+def _texts(messages) -> list[str]:
+    return [m.text for m in messages]
+
+
+@pytest.fixture
+def tailed(tmp_path):
+    """A tailed session file opened at offset 0: (path, state)."""
+    path = tmp_path / "abc123.jsonl"
+    path.touch()
+    fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+    yield path, FileState(fd, "main", "abc123", "abc123", 0)
+    os.close(fd)
+
+
+def test_read_lines_keeps_invalid_utf8_messages(tailed):
+    path, state = tailed
+    path.write_bytes(_line(0).encode().replace(b"m0", b"m\xff") + b"\n")
+
+    lines = _read_lines(state)
+    assert [type(line) for line in lines] == [bytes]
+    msg = parse_line(lines[0], "main", "abc123")
+    assert msg is not None
+    assert msg.text == "m\ufffd"
+
+
+def test_read_lines_holds_a_partial_line_until_it_ends(tailed):
+    path, state = tailed
+    with open(path, "ab") as f:
+        f.write(b"one\ntw")
+    assert _read_lines(state) == [b"one"]
+    assert state.buf == b"tw"
+
+    with open(path, "ab") as f:
+        f.write(b"o\n")
+    assert _read_lines(state) == [b"two"]
+    assert state.buf == b""
+    assert state.offset == 8
+
+
+def test_read_lines_prefilters_non_message_lines(tailed, monkeypatch):
+    path, state = tailed
+    path.write_bytes(b'{"type":"custom","data":{}}\n')
+    monkeypatch.setattr(parse, "json_loads", lambda data: pytest.fail("parsed a custom line"))
+
+    lines = _read_lines(state)
+    assert lines == [b'{"type":"custom","data":{}}']
+    assert parse_line(lines[0], "main", "abc123") is None
+
+
+def test_grown_file_trimmed_for_small_n_is_rescanned_for_larger_n(tmp_path):
+    path = str(tmp_path / "abc123.jsonl")
+    _write(path, 0, 5)
+    messages, entry = _recent_messages(path, "main", None, 10)
+    assert _texts(messages) == [f"m{i}" for i in range(5)]
+    assert entry["complete"]
+
+    _write(path, 5, 7, mode="a")
+    messages, entry = _recent_messages(path, "main", entry, 3)
+    assert _texts(messages) == [f"m{i}" for i in range(2, 7)]
+    assert not entry["complete"]
+
+    messages, entry = _recent_messages(path, "main", entry, 10)
+    assert _texts(messages) == [f"m{i}" for i in range(7)]
+    assert entry["complete"]
+
+
+def test_unchanged_floor_stopped_entry_is_served_from_cache(tmp_path):
+    path = str(tmp_path / "abc123.jsonl")
+    _write(path, 0, 5)
+    floor = _recent_messages(path, "main", None, 10)[0][3].timestamp.timestamp()
+    messages, entry = _recent_messages(path, "main", None, 10, floor)
+    assert _texts(messages) == ["m3", "m4"]
+    assert entry["stopped_at"] == messages[0].timestamp.timestamp() - 1
+
+    cached_messages, cached_entry = _recent_messages(path, "main", entry, 10)
+    assert cached_entry is entry
+    assert _texts(cached_messages) == ["m3", "m4"]
+
+
+def test_grown_file_is_served_from_the_appended_tail(tmp_path):
+    path = str(tmp_path / "abc123.jsonl")
+    _write(path, 0, 4)
+    _, entry = _recent_messages(path, "main", None, 3)
+
+    _write(path, 4, 9, mode="a")
+    with open(path, "ab") as f:
+        f.write(b'{"type":"message"')  # a line still being written
+    messages, entry = _recent_messages(path, "main", entry, 3)
+    assert _texts(messages) == ["m6", "m7", "m8"]
+    assert not entry["complete"]
+
+    # The partial line counts once it is finished
+    with open(path, "a") as f:
+        f.write("}\n" + _line(9) + "\n")
+    messages, entry = _recent_messages(path, "main", entry, 3)
+    assert _texts(messages) == ["m7", "m8", "m9"]
+    assert entry["offset"] == os.path.getsize(path)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 16, 4096])
+def test_reverse_lines_matches_a_forward_split(tmp_path, monkeypatch, chunk_size):
+    monkeypatch.setattr(tail, "REVERSE_CHUNK_SIZE", chunk_size)
+    data = b"first\n\n" + b"x" * 100 + b"\nshort\npartial"
+    path = tmp_path / "abc123.jsonl"
+    path.write_bytes(data)
+
+    with open(path, "rb") as f:
+        lines = list(_reverse_lines(f, len(data)))
+    assert lines == [(108, b"short"), (7, b"x" * 100), (6, b""), (0, b"first")]
+    assert all(type(line) is bytes for _, line in lines)
+
+
+def test_truncated_file_is_read_again_from_the_top(tailed, monkeypatch, capsys):
+    monkeypatch.setattr(tail, "_ISATTY", False)
+    path, state = tailed
+    tailer = SessionTailer(["main"])
+    try:
+        _write(path, 0, 3)
+        assert tailer._read_new_messages([state])
+        assert "m2" in capsys.readouterr().out
+
+        # Rewritten shorter in place, e.g. by a session reset
+        _write(path, 7, 8)
+        assert tailer._read_new_messages([state])
+        out = capsys.readouterr().out
+        assert "m7" in out
+        assert "m0" not in out
+        assert state.offset == os.path.getsize(path)
+    finally:
+        tailer._watcher.close()